@@ -1,23 +1,224 @@
-import base64
-import requests
-from collections.abc import Iterable
+import itertools
+import logging
+import mmap
+import stat
+import threading
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from os import PathLike
 from pathlib import Path
-from typing import Union, Optional, Any
+from typing import TYPE_CHECKING, Union, Optional, Any
+from urllib.parse import urlsplit, urlunsplit
 
 from deluge_web_client.exceptions import DelugeWebClientError
 from deluge_web_client.response import Response
 from deluge_web_client.types import ParamArgs
 
+if TYPE_CHECKING:
+    import requests
+
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    def _loads(data: bytes) -> Any:
+        return orjson.loads(data)
+except ImportError:
+    import json
+
+    # json.dumps builds a new encoder per call whenever it's given options
+    _json_encoder = json.JSONEncoder(separators=(",", ":"))
+
+    def _dumps(obj: Any) -> bytes:
+        return _json_encoder.encode(obj).encode("utf-8")
+
+    def _loads(data: bytes) -> Any:
+        return json.loads(data)
+
+
+try:
+    import pybase64
+
+    def _b64encode(data: Union[bytes, memoryview]) -> bytes:
+        return pybase64.b64encode(data)
+except ImportError:
+    import base64
+
+    def _b64encode(data: Union[bytes, memoryview]) -> bytes:
+        return base64.b64encode(data)
+
+
+logger = logging.getLogger(__name__)
+
+_B64_CHUNK_SIZE = 57 * 1024
+
+
+def _encode_torrent_file(torrent_path: Path) -> str:
+    """
+    Base64 encodes a torrent file that can't be streamed by `_TorrentFileBody`
+    (empty files and streams such as pipes), reading it in chunks sized to a
+    multiple of 3 so the encoded pieces join cleanly
+    """
+    encoded = bytearray()
+    chunk = bytearray(_B64_CHUNK_SIZE)
+    view = memoryview(chunk)
+    with open(torrent_path, "rb") as tf:
+        # the buffered reader fills the whole chunk unless it hits EOF
+        while read := tf.readinto(chunk):
+            encoded += _b64encode(view[:read])
+    view.release()
+    return encoded.decode("ascii")
+
+
+class _TorrentFileBody:
+    """
+    Request body for `core.add_torrent_file` that base64 encodes the torrent
+    file chunk by chunk while it's being sent, so neither the encoded file nor
+    the serialized payload is ever held in memory as a whole.
+
+    The file is memory mapped and re-read on every iteration, allowing the
+    request to be retried. `__len__` lets requests send a Content-Length
+    instead of falling back to a chunked transfer.
+    """
+
+    def __init__(
+        self, torrent_path: Path, size: int, args: ParamArgs, request_id: int
+    ) -> None:
+        self.torrent_path = torrent_path
+        self.size = size
+        self.prefix = (
+            b'{"method":"core.add_torrent_file","params":['
+            + _dumps(str(torrent_path))
+            + b',"'
+        )
+        self.suffix = b'",' + _dumps(args) + b'],"id":%d}' % request_id
+
+    def __len__(self) -> int:
+        return len(self.prefix) + -(-self.size // 3) * 4 + len(self.suffix)
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield self.prefix
+        with open(self.torrent_path, "rb") as tf:
+            with mmap.mmap(tf.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                view = memoryview(mm)
+                try:
+                    for offset in range(0, self.size, _B64_CHUNK_SIZE):
+                        yield _b64encode(view[offset : offset + _B64_CHUNK_SIZE])
+                finally:
+                    view.release()
+        yield self.suffix
+
+
+def _normalize_exception(exc_str: Any) -> Union[str, Any]:
+    """
+    Removes the un-needed ending square bracket and stripping extra white
+    space if input is a string, empty errors are normalized to None
+    """
+    if exc_str is None or exc_str == "":
+        return None
+    if exc_str.__class__ is not str:
+        return exc_str
+    if exc_str.endswith("]"):
+        exc_str = exc_str.rstrip("]")
+    return exc_str.strip()
+
+
+@lru_cache(maxsize=32)
+def _build_url(url: str) -> str:
+    """Automatically fixes urls as needed to access the json api endpoint"""
+    parts = urlsplit(url)
+    path = parts.path.rstrip("/")
+    if not path.endswith("/json"):
+        path += "/json"
+    return urlunsplit(parts._replace(path=path))
+
+
+def _payload_template(method: str) -> bytes:
+    """
+    Pre-serializes a parameterless call up to (but not including) its id,
+    see `DelugeWebClient._execute_template`
+    """
+    return b'{"method":' + _dumps(method) + b',"params":[],"id":'
+
 
 class DelugeWebClient:
     HEADERS = {"Content-Type": "application/json", "Accept": "application/json"}
-    ID = 0
 
-    def __init__(self, url: str = "", password: str = "") -> None:
-        self.session = requests.Session()
-        self.url = self._build_url(url)
+    _PAYLOAD_CHECK_CONNECTED = _payload_template("web.connected")
+    _PAYLOAD_DISCONNECT = _payload_template("web.disconnect")
+    _PAYLOAD_GET_HOSTS = _payload_template("web.get_hosts")
+    _PAYLOAD_GET_LABELS = _payload_template("label.get_labels")
+    _PAYLOAD_GET_LIBTORRENT_VERSION = _payload_template("core.get_libtorrent_version")
+    _PAYLOAD_GET_LISTEN_PORT = _payload_template("core.get_listen_port")
+    _PAYLOAD_GET_PLUGINS = _payload_template("web.get_plugins")
+    _PAYLOAD_TEST_LISTEN_PORT = _payload_template("core.test_listen_port")
+
+    def __init__(
+        self, url: str = "", password: str = "", pool_maxsize: int = 32
+    ) -> None:
+        """
+        Args:
+            url (str): URL of the Web UI, the json api endpoint is appended as needed.
+            password (str): Password for the Web UI.
+            pool_maxsize (int): Maximum number of connections kept alive to the Web UI,
+                raise this when uploading with many concurrent workers. Defaults to 32.
+        """
+        # created on first use, importing requests is a large share of the
+        # import time of this package
+        self._session: Optional["requests.Session"] = None
+        self._session_lock = threading.Lock()
+        self.pool_maxsize = pool_maxsize
+        self.url = _build_url(url)
         self.password = password
+        # itertools.count hands out each id atomically, keeping ids unique
+        # across threads and asyncio uploads
+        self._next_id = itertools.count().__next__
+        # labels already added by `_apply_label`, so later uploads with the
+        # same label only need the label.set_torrent call
+        self._added_labels: dict[str, Response] = {}
+
+    @property
+    def session(self) -> "requests.Session":
+        """The `requests.Session` used for every call, created on first access"""
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = self._create_session()
+        return self._session
+
+    @session.setter
+    def session(self, session: "requests.Session") -> None:
+        # the JSON headers live on the session rather than on each post
+        session.headers.update(self.HEADERS)
+        self._session = session
+
+    def _create_session(self) -> "requests.Session":
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        session = requests.Session()
+        session.headers.update(self.HEADERS)
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=Retry(
+                total=3,
+                # a read timeout means the server may have handled the call
+                # already, re-sending it would repeat non-idempotent calls
+                read=False,
+                backoff_factor=0.1,
+                status_forcelist=(502, 503, 504),
+                allowed_methods=frozenset(["POST"]),
+                raise_on_status=False,
+            ),
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
 
     def __enter__(self) -> "DelugeWebClient":
         """Login and connect to client while using with statement."""
@@ -54,7 +255,7 @@ class DelugeWebClient:
         login_payload = {
             "method": "auth.login",
             "params": [self.password],
-            "id": self.ID,
+            "id": self._next_id(),
         }
         return self.execute_call(login_payload, timeout=timeout)
 
@@ -66,14 +267,15 @@ class DelugeWebClient:
         """Attempt to connect to the first available host."""
         hosts = self.get_hosts()
 
-        if isinstance(hosts.result, list) and hosts.result:
-            host_info = hosts.result[0]
-            if isinstance(host_info, list) and host_info:
-                host_id = host_info[0]
-                connect_response = self.connect_to_host(host_id)
-                if connect_response.result:
-                    return self.check_connected(timeout)
+        # hosts are returned as [[host_id, host, port, status], ...]
+        try:
+            host_id = hosts.result[0][0]  # type: ignore[index]
+        except (TypeError, IndexError, KeyError):
+            return self._create_failure_response("Failed to connect to host")
 
+        connect_response = self.connect_to_host(host_id)
+        if connect_response.result:
+            return self.check_connected(timeout)
         return self._create_failure_response("Failed to connect to host")
 
     def _create_failure_response(self, error_message: str) -> Response:
@@ -86,7 +288,8 @@ class DelugeWebClient:
         This is handled automatically
         when `DelugeWebClient` is used in a context manager.
         """
-        self.session.close()
+        if self._session is not None:
+            self._session.close()
 
     def disconnect(self, timeout: int = 30) -> Response:
         """
@@ -94,12 +297,7 @@ class DelugeWebClient:
         Note: This disconnects from all of your logged in instances outside of this program as well
         that is tied to that user/password. Only use this IF needed not on each call.
         """
-        payload = {
-            "method": "web.disconnect",
-            "params": [],
-            "id": self.ID,
-        }
-        return self.execute_call(payload, timeout=timeout)
+        return self._execute_template(self._PAYLOAD_DISCONNECT, timeout)
 
     def upload_torrent(
         self,
@@ -127,27 +325,26 @@ class DelugeWebClient:
         Returns:
             Response: Response object.
         """
-        torrent_path = Path(torrent_path)
-        with open(torrent_path, "rb") as tf:
-            args = ParamArgs(
-                add_paused=add_paused,
-                seed_mode=seed_mode,
-                auto_managed=auto_managed,
-                download_location=None,
+        args = self._build_add_args(add_paused, seed_mode, auto_managed, save_directory)
+        return self._upload_torrent_with_args(Path(torrent_path), args, label, timeout)
+
+    def _upload_torrent_with_args(
+        self, torrent_path: Path, args: ParamArgs, label: Optional[str], timeout: int
+    ) -> Response:
+        """Uploads a single torrent file with already built add torrent options"""
+        file_stat = torrent_path.stat()
+        if file_stat.st_size and stat.S_ISREG(file_stat.st_mode):
+            body = _TorrentFileBody(
+                torrent_path, file_stat.st_size, args, self._next_id()
             )
-            if save_directory:
-                args["download_location"] = str(save_directory)
-            params = [
-                str(torrent_path),
-                str(base64.b64encode(tf.read()), encoding="utf-8"),
-                args,
-            ]
-            payload = {
-                "method": "core.add_torrent_file",
-                "params": params,
-                "id": self.ID,
-            }
-            return self._upload_helper(payload, label, timeout)
+            return self._upload_raw(body, label, timeout)
+
+        payload = {
+            "method": "core.add_torrent_file",
+            "params": [str(torrent_path), _encode_torrent_file(torrent_path), args],
+            "id": self._next_id(),
+        }
+        return self._upload_helper(payload, label, timeout)
 
     def upload_torrents(
         self,
@@ -155,6 +352,7 @@ class DelugeWebClient:
         save_directory: Optional[str] = None,
         label: Optional[str] = None,
         timeout: int = 30,
+        max_workers: int = 1,
     ) -> dict[str, Response]:
         """
         Uploads multiple torrents.
@@ -164,25 +362,99 @@ class DelugeWebClient:
             save_directory (str, optional): Defined path where the file should go on the host. Defaults to None.
             label (str, optional): Label to apply to uploaded torrents. Defaults to None.
             timeout (int): Time to timeout.
+            max_workers (int): Number of torrents to upload concurrently over the shared session,
+                each worker base64 encodes its torrent while sending it. Defaults to 1 (sequential uploads).
 
         Returns:
             dict[str, Response]: A dictionary of torrent name and Response objects for each torrent.
         """
+        args = self._build_add_args(False, False, False, save_directory)
+
+        def upload(torrent_path: Path) -> Response:
+            return self._upload_torrent_with_args(torrent_path, args, label, timeout)
+
+        torrent_paths = [Path(torrent_path) for torrent_path in torrents]
+        executor = ThreadPoolExecutor(max_workers) if max_workers > 1 else None
+        responses = (executor.map if executor else map)(upload, torrent_paths)
+
         results = {}
-        for torrent_path in torrents:
-            torrent_path = Path(torrent_path)
-            try:
-                response = self.upload_torrent(
-                    torrent_path,
-                    save_directory=save_directory,
-                    label=label,
-                    timeout=timeout,
-                )
-                results[torrent_path.stem] = response
-            except Exception as e:
+        try:
+            for torrent_path in torrent_paths:
+                try:
+                    results[torrent_path.stem] = next(responses)
+                except Exception as e:
+                    raise DelugeWebClientError(
+                        f"Failed to upload {torrent_path.name}:\n{e}"
+                    )
+        finally:
+            if executor:
+                executor.shutdown(cancel_futures=True)
+
+        return results
+
+    async def upload_torrents_async(
+        self,
+        torrents: Iterable[Union[PathLike[str], str, Path]],
+        save_directory: Optional[str] = None,
+        label: Optional[str] = None,
+        timeout: int = 30,
+        max_concurrency: int = 8,
+    ) -> dict[str, Response]:
+        """
+        Uploads multiple torrents concurrently from within an asyncio event loop.
+
+        Each upload runs in a worker thread over the client's session, so the
+        event loop is never blocked on file reads or HTTP round trips. The first
+        failed upload skips any uploads that haven't started yet.
+
+        Args:
+            torrents (Iterable[Union[PathLike[str], str, Path]]): A list or other iterable of torrent file paths.
+            save_directory (str, optional): Defined path where the file should go on the host. Defaults to None.
+            label (str, optional): Label to apply to uploaded torrents. Defaults to None.
+            timeout (int): Time to timeout.
+            max_concurrency (int): Maximum number of uploads in flight at once. Defaults to 8.
+
+        Returns:
+            dict[str, Response]: A dictionary of torrent name and Response objects for each torrent.
+        """
+        import asyncio
+
+        args = self._build_add_args(False, False, False, save_directory)
+        semaphore = asyncio.Semaphore(max_concurrency)
+        failed = False
+
+        async def upload(torrent_path: Path) -> Optional[Response]:
+            nonlocal failed
+            async with semaphore:
+                # skip uploads still queued once another one has failed
+                if failed:
+                    return None
+                try:
+                    return await asyncio.to_thread(
+                        self._upload_torrent_with_args,
+                        torrent_path,
+                        args,
+                        label,
+                        timeout,
+                    )
+                except Exception:
+                    failed = True
+                    raise
+
+        torrent_paths = [Path(torrent_path) for torrent_path in torrents]
+        responses = await asyncio.gather(
+            *(upload(torrent_path) for torrent_path in torrent_paths),
+            return_exceptions=True,
+        )
+
+        results = {}
+        for torrent_path, response in zip(torrent_paths, responses):
+            if isinstance(response, BaseException):
                 raise DelugeWebClientError(
-                    f"Failed to upload {torrent_path.name}:\n{e}"
+                    f"Failed to upload {torrent_path.name}:\n{response}"
                 )
+            if response is not None:
+                results[torrent_path.stem] = response
 
         return results
 
@@ -211,18 +483,11 @@ class DelugeWebClient:
             Response: Response object.
 
         """
-        args = ParamArgs(
-            add_paused=add_paused,
-            seed_mode=seed_mode,
-            auto_managed=auto_managed,
-            download_location=None,
-        )
-        if save_directory:
-            args["download_location"] = str(save_directory)
+        args = self._build_add_args(add_paused, seed_mode, auto_managed, save_directory)
         payload = {
             "method": "core.add_torrent_magnet",
             "params": [str(uri), args],
-            "id": self.ID,
+            "id": self._next_id(),
         }
         return self._upload_helper(payload, label, timeout)
 
@@ -250,39 +515,52 @@ class DelugeWebClient:
         Returns:
             Response: Response object.
         """
-        args = ParamArgs(
-            add_paused=add_paused,
-            seed_mode=seed_mode,
-            auto_managed=auto_managed,
-            download_location=None,
-        )
-        if save_directory:
-            args["download_location"] = str(save_directory)
+        args = self._build_add_args(add_paused, seed_mode, auto_managed, save_directory)
         payload = {
             "method": "core.add_torrent_url",
             "params": [str(url), args],
-            "id": self.ID,
+            "id": self._next_id(),
         }
         return self._upload_helper(payload, label, timeout)
 
+    @staticmethod
+    def _build_add_args(
+        add_paused: bool,
+        seed_mode: bool,
+        auto_managed: bool,
+        save_directory: Optional[str],
+    ) -> ParamArgs:
+        """Builds the options dictionary shared by the add torrent methods"""
+        return ParamArgs(
+            add_paused=add_paused,
+            seed_mode=seed_mode,
+            auto_managed=auto_managed,
+            download_location=str(save_directory) if save_directory else None,
+        )
+
     def _upload_helper(
         self, payload: dict, label: Optional[str], timeout: int
     ) -> Response:
-        with self.session.post(
-            self.url, headers=self.HEADERS, json=payload, timeout=timeout
-        ) as response:
-            self.ID += 1
-            if response.ok:
-                result = response.json()
-                info_hash = str(result["result"])
-                if label:
-                    self._apply_label(info_hash, str(label), timeout)
-                self.resume_torrent(info_hash, timeout)
-                return Response(result=info_hash, error=None, id=1)
-            else:
-                raise DelugeWebClientError(
-                    f"Failed to upload file. Status code: {response.status_code}, Reason: {response.reason}"
-                )
+        return self._upload_raw(_dumps(payload), label, timeout)
+
+    def _upload_raw(
+        self,
+        body: Union[bytes, _TorrentFileBody],
+        label: Optional[str],
+        timeout: int,
+    ) -> Response:
+        """Posts an already serialized upload payload, see `_upload_helper`"""
+        response = self._post(body, timeout)
+        if response.status_code >= 400:
+            raise DelugeWebClientError(
+                f"Failed to upload file. Status code: {response.status_code}, Reason: {response.reason}"
+            )
+
+        info_hash = str(_loads(response.content)["result"])
+        if label:
+            self._apply_label(info_hash, str(label), timeout)
+        self.resume_torrent(info_hash, timeout)
+        return Response(result=info_hash, error=None, id=1)
 
     def _apply_label(
         self, info_hash: str, label: str, timeout: int
@@ -299,8 +577,18 @@ class DelugeWebClient:
         Returns:
             tuple (bool, bool): add_label(), set_label().
         """
-        add_label = self.add_label(label, timeout)
-        set_label = self.set_label(info_hash, label, timeout)
+        label = label.lower()
+        add_label = self._added_labels.get(label)
+        if add_label is not None:
+            try:
+                return add_label, self._set_label_raw(info_hash, label, timeout)
+            except DelugeWebClientError:
+                # the label may have been removed since it was added, add it again
+                self._added_labels.pop(label, None)
+
+        add_label = self._add_label_raw(label, timeout)
+        self._added_labels[label] = add_label
+        set_label = self._set_label_raw(info_hash, label, timeout)
         return add_label, set_label
 
     def get_free_space(
@@ -310,7 +598,7 @@ class DelugeWebClient:
         payload = {
             "method": "core.get_free_space",
             "params": [str(path)] if path else [],
-            "id": self.ID,
+            "id": self._next_id(),
         }
         return self.execute_call(payload, timeout=timeout)
 
@@ -326,34 +614,37 @@ class DelugeWebClient:
         payload = {
             "method": "core.get_path_size",
             "params": [str(path)] if path else [],
-            "id": self.ID,
+            "id": self._next_id(),
         }
         return self.execute_call(payload, timeout=timeout)
 
     def get_labels(self, timeout: int = 30) -> Response:
         """Gets defined labels"""
-        payload = {
-            "method": "label.get_labels",
-            "params": [],
-            "id": self.ID,
-        }
-        return self.execute_call(payload, timeout=timeout)
+        return self._execute_template(self._PAYLOAD_GET_LABELS, timeout)
 
     def set_label(self, info_hash: str, label: str, timeout: int = 30) -> Response:
         """Sets the label for a specific torrent"""
+        return self._set_label_raw(info_hash, label.lower(), timeout)
+
+    def _set_label_raw(self, info_hash: str, label: str, timeout: int) -> Response:
+        """`set_label` for a label that is already lowercase"""
         payload = {
             "method": "label.set_torrent",
-            "params": [info_hash, label.lower()],
-            "id": self.ID,
+            "params": [info_hash, label],
+            "id": self._next_id(),
         }
         return self.execute_call(payload, timeout=timeout)
 
     def add_label(self, label: str, timeout: int = 30) -> Response:
         """Adds a label to the client, ignoring labels if they already exist"""
+        return self._add_label_raw(label.lower(), timeout)
+
+    def _add_label_raw(self, label: str, timeout: int) -> Response:
+        """`add_label` for a label that is already lowercase"""
         payload = {
             "method": "label.add",
-            "params": [label.lower()],
-            "id": self.ID,
+            "params": [label],
+            "id": self._next_id(),
         }
         response = self.execute_call(payload, handle_error=False, timeout=timeout)
         if response.error is None:
@@ -368,37 +659,22 @@ class DelugeWebClient:
 
     def get_libtorrent_version(self, timeout: int = 30) -> Response:
         """Gets libtorrent version"""
-        payload = {
-            "method": "core.get_libtorrent_version",
-            "params": [],
-            "id": self.ID,
-        }
-        return self.execute_call(payload, timeout=timeout)
+        return self._execute_template(self._PAYLOAD_GET_LIBTORRENT_VERSION, timeout)
 
     def get_listen_port(self, timeout: int = 30) -> Response:
         """Gets listen port"""
-        payload = {
-            "method": "core.get_listen_port",
-            "params": [],
-            "id": self.ID,
-        }
-        return self.execute_call(payload, timeout=timeout)
+        return self._execute_template(self._PAYLOAD_GET_LISTEN_PORT, timeout)
 
     def get_plugins(self, timeout: int = 30) -> Response:
         """Gets plugins"""
-        payload = {
-            "method": "web.get_plugins",
-            "params": [],
-            "id": self.ID,
-        }
-        return self.execute_call(payload, timeout=timeout)
+        return self._execute_template(self._PAYLOAD_GET_PLUGINS, timeout)
 
     def get_torrent_files(self, torrent_id: str, timeout: int = 30) -> Response:
         """Gets the files for a torrent in tree format"""
         payload = {
             "method": "web.get_torrent_files",
             "params": [torrent_id],
-            "id": self.ID,
+            "id": self._next_id(),
         }
         return self.execute_call(payload, timeout=timeout)
 
@@ -424,7 +700,7 @@ class DelugeWebClient:
         payload = {
             "method": "core.get_torrent_status",
             "params": [torrent_id, keys, diff],
-            "id": self.ID,
+            "id": self._next_id(),
         }
         return self.execute_call(payload, timeout=timeout)
 
@@ -457,7 +733,7 @@ class DelugeWebClient:
         payload = {
             "method": "core.get_torrents_status",
             "params": [filter_dict, keys, diff],
-            "id": self.ID,
+            "id": self._next_id(),
         }
         return self.execute_call(payload, timeout=timeout)
 
@@ -466,28 +742,18 @@ class DelugeWebClient:
         Use the `web.connected` method to get a boolean response if the Web UI is
         connected to a deluged host
         """
-        payload = {
-            "method": "web.connected",
-            "params": [],
-            "id": self.ID,
-        }
-        return self.execute_call(payload, timeout=timeout)
+        return self._execute_template(self._PAYLOAD_CHECK_CONNECTED, timeout)
 
     def get_hosts(self, timeout: int = 30) -> Response:
         """Returns hosts we're connected to currently"""
-        payload = {
-            "method": "web.get_hosts",
-            "params": [],
-            "id": self.ID,
-        }
-        return self.execute_call(payload, timeout=timeout)
+        return self._execute_template(self._PAYLOAD_GET_HOSTS, timeout)
 
     def get_host_status(self, host_id: str, timeout: int = 30) -> Response:
         """Get the deluged host status `<hostID>`"""
         payload = {
             "method": "web.get_host_status",
             "params": [host_id],
-            "id": self.ID,
+            "id": self._next_id(),
         }
         return self.execute_call(payload, timeout=timeout)
 
@@ -496,7 +762,7 @@ class DelugeWebClient:
         payload = {
             "method": "web.connect",
             "params": [host_id],
-            "id": self.ID,
+            "id": self._next_id(),
         }
         return self.execute_call(payload, timeout=timeout)
 
@@ -506,12 +772,7 @@ class DelugeWebClient:
         Returns:
             bool: If active port is opened or closed
         """
-        payload = {
-            "method": "core.test_listen_port",
-            "params": [],
-            "id": self.ID,
-        }
-        check_port = self.execute_call(payload, timeout=timeout)
+        check_port = self._execute_template(self._PAYLOAD_TEST_LISTEN_PORT, timeout)
         if check_port.result is not None:
             return True
         return False
@@ -521,7 +782,7 @@ class DelugeWebClient:
         payload = {
             "method": "core.pause_torrent",
             "params": [torrent_id],
-            "id": self.ID,
+            "id": self._next_id(),
         }
         return self.execute_call(payload, timeout=timeout)
 
@@ -530,7 +791,7 @@ class DelugeWebClient:
         payload = {
             "method": "core.pause_torrents",
             "params": [torrent_ids],
-            "id": self.ID,
+            "id": self._next_id(),
         }
         return self.execute_call(payload, timeout=timeout)
 
@@ -539,7 +800,7 @@ class DelugeWebClient:
         payload = {
             "method": "core.remove_torrent",
             "params": [torrent_id],
-            "id": self.ID,
+            "id": self._next_id(),
         }
         return self.execute_call(payload, timeout=timeout)
 
@@ -548,7 +809,7 @@ class DelugeWebClient:
         payload = {
             "method": "core.remove_torrents",
             "params": [torrent_ids],
-            "id": self.ID,
+            "id": self._next_id(),
         }
         return self.execute_call(payload, timeout=timeout)
 
@@ -557,7 +818,7 @@ class DelugeWebClient:
         payload = {
             "method": "core.resume_torrent",
             "params": [torrent_id],
-            "id": self.ID,
+            "id": self._next_id(),
         }
         return self.execute_call(payload, timeout=timeout)
 
@@ -566,7 +827,7 @@ class DelugeWebClient:
         payload = {
             "method": "core.resume_torrents",
             "params": [torrent_ids],
-            "id": self.ID,
+            "id": self._next_id(),
         }
         return self.execute_call(payload, timeout=timeout)
 
@@ -577,7 +838,7 @@ class DelugeWebClient:
         payload = {
             "method": "core.set_torrent_trackers",
             "params": [torrent_id, trackers],
-            "id": self.ID,
+            "id": self._next_id(),
         }
         return self.execute_call(payload, timeout=timeout)
 
@@ -596,45 +857,41 @@ class DelugeWebClient:
         Returns:
             Response: Response object for each call.
         """
-        with self.session.post(
-            self.url, headers=self.HEADERS, json=payload, timeout=timeout
-        ) as response:
-            self.ID += 1
-            if response.ok:
-                response_json = response.json()
-                data = Response(
-                    result=response_json.get("result"),
-                    error=self._normalize_exception(response_json.get("error")),
-                    id=response_json.get("id"),
-                )
-                if handle_error and data.error:
-                    raise DelugeWebClientError(
-                        f"Payload: {payload}, Error: {data.error}"
-                    )
-                return data
-            else:
-                raise DelugeWebClientError(
-                    f"Failed to execute call. Response code: {response.status_code}. Reason: {response.reason}"
-                )
+        return self._execute_raw(_dumps(payload), handle_error, timeout)
 
-    @staticmethod
-    def _normalize_exception(exc_str: Any) -> Union[str, Any]:
-        """
-        Removes the un-needed ending square bracket and stripping extra white
-        space if input is a string
+    def _execute_template(self, template: bytes, timeout: int) -> Response:
+        """Executes a pre-serialized parameterless call with the next request id"""
+        return self._execute_raw(
+            b"%s%d}" % (template, self._next_id()), timeout=timeout
+        )
+
+    def _post(
+        self, body: Union[bytes, _TorrentFileBody], timeout: int
+    ) -> "requests.Response":
         """
-        if isinstance(exc_str, str):
-            return exc_str.rstrip("]").strip()
-        else:
-            return exc_str
+        Single place where serialized payloads are sent to the json api endpoint.
 
-    @staticmethod
-    def _build_url(url: str) -> str:
-        """Automatically fixes urls as needed to access the json api endpoint"""
-        if not url.endswith("/"):
-            url += "/"
+        The response body is read before this returns (requests doesn't stream
+        by default), so the connection is already back in the pool and the
+        response doesn't need to be closed by the caller.
+        """
+        return self.session.post(self.url, data=body, timeout=timeout)
 
-        if "json" not in url:
-            url += "json/"
+    def _execute_raw(
+        self, body: bytes, handle_error: bool = True, timeout: int = 30
+    ) -> Response:
+        """Posts an already serialized payload, see `execute_call`"""
+        response = self._post(body, timeout)
+        # same check as response.ok without its raise_for_status round trip
+        if response.status_code >= 400:
+            raise DelugeWebClientError(
+                f"Failed to execute call. Response code: {response.status_code}. Reason: {response.reason}"
+            )
 
-        return url.rstrip("/")
+        response_json = _loads(response.content)
+        logger.debug("RPC response: %r", response_json)
+        get = response_json.get
+        data = Response(get("result"), _normalize_exception(get("error")), get("id"))
+        if handle_error and data.error:
+            raise DelugeWebClientError(f"Payload: {body.decode()}, Error: {data.error}")
+        return data
@@ -1,12 +1,9 @@
-from dataclasses import dataclass
-from typing import Union, Optional
+from typing import NamedTuple, Union, Optional
 
 
-@dataclass
-class Response:
+class Response(NamedTuple):
     """Object that is filled on each request"""
 
-    __slots__ = ("result", "error", "id")
     result: Union[bool, str, list, None]
     error: Union[None, str, dict]
     id: Optional[int]
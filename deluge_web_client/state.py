@@ -23,8 +23,20 @@ class TorrentState(Enum):
     @classmethod
     def _missing_(cls, value):
         """Override this method to ignore case sensitivity"""
-        value = value.lower()
-        for member in cls:
-            if member.name.lower() == value:
+        if isinstance(value, str):
+            value = value.lower()
+            member = _LOWERCASE_MEMBERS.get(value)
+            if member is not None:
                 return member
         raise ValueError(f"No {cls.__name__} member with value '{value}'")
+
+
+# built once so case insensitive lookups are a single dict lookup
+_LOWERCASE_MEMBERS = {member.name.lower(): member for member in TorrentState}
+
+# resolve the common lower and upper case spellings the same way as the
+# canonical values, without falling back to `_missing_`
+for _member in TorrentState:
+    TorrentState._value2member_map_[_member.value.lower()] = _member
+    TorrentState._value2member_map_[_member.value.upper()] = _member
+del _member
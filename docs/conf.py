@@ -24,18 +24,13 @@ author = "jessielw"
 extensions = [
     "sphinx.ext.autodoc",
     "sphinx.ext.napoleon",
-    "sphinx_autodoc_typehints",
 ]
 
-always_use_bars_union = True
 add_module_names = False
+autodoc_typehints = "description"
 autodoc_typehints_format = "short"
 python_use_unqualified_type_names = True
 python_use_unqualified_names = True
-typehints_fully_qualified = False
-typehints_use_signature = False
-typehints_use_signature_return = True
-typehints_document_rtype = True
 
 source_suffix = ".rst"
 
@@ -1,6 +1,7 @@
 import pytest
 from unittest.mock import patch
 from deluge_web_client import DelugeWebClient
+from tests import example_status_dict, example_multi_status_dict
 
 
 @pytest.fixture
@@ -11,3 +12,25 @@ def client_mock():
             url="http://mocked-deluge-url", password="mocked_password"
         )
         yield client, mock_post
+        # release any pooled connections a test created through client.session
+        client.close_session()
+
+
+@pytest.fixture
+def mock_upload_helper(client_mock):
+    """Fixture to patch `_upload_helper` on the `client_mock` client."""
+    client, _ = client_mock
+    with patch.object(client, "_upload_helper") as mock_upload_helper:
+        yield mock_upload_helper
+
+
+@pytest.fixture(scope="session")
+def status_dict():
+    """Read-only torrent status shared by every test that needs one."""
+    return example_status_dict
+
+
+@pytest.fixture(scope="session")
+def multi_status_dict():
+    """Read-only status of two torrents, both referencing `status_dict`."""
+    return example_multi_status_dict
@@ -7,9 +7,7 @@ from deluge_web_client import DelugeWebClientError, Response
 def test_failure_to_connect(client_mock):
     client, mock_post = client_mock
 
-    mock_post.side_effect = (
-        MockResponse(ok=False, status_code=404, reason="Not Found"),
-    )
+    mock_post.return_value = MockResponse(ok=False, status_code=404, reason="Not Found")
 
     with pytest.raises(
         DelugeWebClientError,
@@ -150,6 +148,22 @@ def test_host_connection_failure(client_mock):
     )  # Connect to the first host
 
 
+@pytest.mark.parametrize("hosts", [None, [], [[]], {"host_id_1": None}])
+def test_no_usable_host(client_mock, hosts):
+    client, _ = client_mock
+
+    client.get_hosts = MagicMock(
+        return_value=Response(result=hosts, error=None, id=None)
+    )
+    client.connect_to_host = MagicMock()
+
+    response = client._connect_to_first_host(timeout=30)
+
+    assert response.result is False
+    assert response.error == "Failed to connect to host"
+    client.connect_to_host.assert_not_called()
+
+
 def test_close_session(client_mock):
     client, _ = client_mock
 
@@ -161,12 +175,10 @@ def test_close_session(client_mock):
 def test_disconnect(client_mock):
     client, mock_post = client_mock
 
-    mock_post.side_effect = (
-        MockResponse(
-            {"result": "Connection was closed cleanly.", "error": None, "id": 0},
-            True,
-            200,
-        ),
+    mock_post.return_value = MockResponse(
+        {"result": "Connection was closed cleanly.", "error": None, "id": 0},
+        True,
+        200,
     )
 
     response = client.disconnect()
@@ -1,7 +1,10 @@
+import logging
 import pytest
+import requests
 from unittest.mock import MagicMock, patch
-from tests import MockResponse
-from deluge_web_client import DelugeWebClientError
+from tests import MockResponse, null_response, posted_payload
+from deluge_web_client import DelugeWebClient, DelugeWebClientError
+from deluge_web_client.client import _build_url, _normalize_exception
 
 
 def test_enter(client_mock):
@@ -20,7 +23,7 @@ def test_exit(client_mock):
     mock_response = MockResponse(
         {"result": True, "error": None, "id": 0}, ok=True, status_code=200
     )
-    mock_post.return_value.__enter__.return_value = mock_response
+    mock_post.return_value = mock_response
 
     client.close_session = MagicMock()
 
@@ -30,40 +33,101 @@ def test_exit(client_mock):
     client.close_session.assert_called_once()
 
 
+def test_session_configuration(client_mock):
+    client, _ = client_mock
+
+    assert client.session.headers["Content-Type"] == "application/json"
+    assert client.session.headers["Accept"] == "application/json"
+
+    adapter = client.session.get_adapter(client.url)
+    assert adapter._pool_maxsize == 32
+    assert adapter.max_retries.total == 3
+    assert 503 in adapter.max_retries.status_forcelist
+    assert adapter.max_retries.read is False
+
+
+def test_pool_maxsize():
+    client = DelugeWebClient(url="http://mocked-deluge-url", pool_maxsize=64)
+
+    assert client.session.get_adapter(client.url)._pool_maxsize == 64
+
+
+def test_session_created_lazily():
+    client = DelugeWebClient(url="http://mocked-deluge-url")
+    assert client._session is None
+
+    # closing before any call has nothing to close
+    client.close_session()
+    assert client._session is None
+
+    assert client.session is client.session
+
+
+def test_assigned_session_sends_json_headers():
+    client = DelugeWebClient(url="http://mocked-deluge-url")
+    client.session = requests.Session()
+
+    # a real response, Session.send post-processes what the adapter returns
+    response = requests.Response()
+    response.status_code = 200
+    response._content = b'{"result": true, "error": null, "id": 0}'
+
+    with patch(
+        "requests.adapters.HTTPAdapter.send", return_value=response
+    ) as mock_send:
+        client.check_connected()
+
+    sent_request = mock_send.call_args[0][0]
+    assert sent_request.headers["Content-Type"] == "application/json"
+    assert sent_request.headers["Accept"] == "application/json"
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        ("http://localhost:8112", "http://localhost:8112/json"),
+        ("http://localhost:8112/", "http://localhost:8112/json"),
+        ("http://localhost:8112/json", "http://localhost:8112/json"),
+        ("http://localhost:8112/json/", "http://localhost:8112/json"),
+        ("https://site.net/deluge", "https://site.net/deluge/json"),
+        ("https://site.net/deluge/json", "https://site.net/deluge/json"),
+        ("https://json.site.net", "https://json.site.net/json"),
+    ],
+)
+def test_build_url(url, expected):
+    assert _build_url(url) == expected
+
+
 def test_get_libtorrent_version(client_mock):
     client, mock_post = client_mock
 
-    mock_post.side_effect = (
-        MockResponse(
-            {"result": "2.0.10.0", "error": None, "id": 0},
-            ok=True,
-            status_code=200,
-        ),
+    mock_post.return_value = MockResponse(
+        {"result": "2.0.10.0", "error": None, "id": 0},
+        ok=True,
+        status_code=200,
     )
 
     response = client.get_libtorrent_version()
     assert response.result == "2.0.10.0"
     assert mock_post.called
     assert mock_post.call_count == 1
-    assert mock_post.call_args[1]["json"]["method"] == "core.get_libtorrent_version"
+    assert posted_payload(mock_post)["method"] == "core.get_libtorrent_version"
 
 
 def test_get_listen_port(client_mock):
     client, mock_post = client_mock
 
-    mock_post.side_effect = (
-        MockResponse(
-            {"result": 6881, "error": None, "id": 0},
-            ok=True,
-            status_code=200,
-        ),
+    mock_post.return_value = MockResponse(
+        {"result": 6881, "error": None, "id": 0},
+        ok=True,
+        status_code=200,
     )
 
     response = client.get_listen_port()
     assert response.result == 6881
     assert mock_post.called
     assert mock_post.call_count == 1
-    assert mock_post.call_args[1]["json"]["method"] == "core.get_listen_port"
+    assert posted_payload(mock_post)["method"] == "core.get_listen_port"
 
 
 def test_get_plugins(client_mock):
@@ -85,41 +149,41 @@ def test_get_plugins(client_mock):
         ],
     }
 
-    mock_post.side_effect = (
-        MockResponse(
-            {
-                "result": result_info,
-                "error": None,
-                "id": 2,
-            },
-            ok=True,
-            status_code=200,
-        ),
+    mock_post.return_value = MockResponse(
+        {
+            "result": result_info,
+            "error": None,
+            "id": 2,
+        },
+        ok=True,
+        status_code=200,
     )
 
     response = client.get_plugins()
     assert response.result == result_info
     assert mock_post.called
     assert mock_post.call_count == 1
-    assert mock_post.call_args[1]["json"]["method"] == "web.get_plugins"
+    assert posted_payload(mock_post)["method"] == "web.get_plugins"
 
 
 def test_check_connected(client_mock):
     client, mock_post = client_mock
 
-    mock_post.side_effect = (
-        MockResponse(
-            {"result": True, "error": None, "id": 0},
-            ok=True,
-            status_code=200,
-        ),
+    mock_post.return_value = MockResponse(
+        {"result": True, "error": None, "id": 0},
+        ok=True,
+        status_code=200,
     )
 
     response = client.check_connected()
     assert response.result is True
     assert mock_post.called
     assert mock_post.call_count == 1
-    assert mock_post.call_args[1]["json"]["method"] == "web.connected"
+    assert posted_payload(mock_post) == {
+        "method": "web.connected",
+        "params": [],
+        "id": 0,
+    }
 
 
 def test_get_hosts(client_mock):
@@ -127,19 +191,17 @@ def test_get_hosts(client_mock):
 
     result_info = [["6a9de8fd92c449f49f6dcexxxxxxxxxx", "127.0.0.1", 58846, "user"]]
 
-    mock_post.side_effect = (
-        MockResponse(
-            {"result": result_info, "error": None, "id": 0},
-            ok=True,
-            status_code=200,
-        ),
+    mock_post.return_value = MockResponse(
+        {"result": result_info, "error": None, "id": 0},
+        ok=True,
+        status_code=200,
     )
 
     response = client.get_hosts()
     assert response.result == result_info
     assert mock_post.called
     assert mock_post.call_count == 1
-    assert mock_post.call_args[1]["json"]["method"] == "web.get_hosts"
+    assert posted_payload(mock_post)["method"] == "web.get_hosts"
 
 
 def test_get_host_status(client_mock):
@@ -148,19 +210,17 @@ def test_get_host_status(client_mock):
     host_id = "6a9de8fd92c449f49f6dcexxxxxxxxxx"
     result_info = [host_id, "Connected", "2.1.1"]
 
-    mock_post.side_effect = (
-        MockResponse(
-            {"result": result_info, "error": None, "id": 0},
-            ok=True,
-            status_code=200,
-        ),
+    mock_post.return_value = MockResponse(
+        {"result": result_info, "error": None, "id": 0},
+        ok=True,
+        status_code=200,
     )
 
     response = client.get_host_status(host_id)
     assert response.result == result_info
     assert mock_post.called
     assert mock_post.call_count == 1
-    assert mock_post.call_args[1]["json"]["method"] == "web.get_host_status"
+    assert posted_payload(mock_post)["method"] == "web.get_host_status"
 
 
 def test_connect_to_host(client_mock):
@@ -176,51 +236,56 @@ def test_connect_to_host(client_mock):
         "...",
     ]
 
-    mock_post.side_effect = (
-        MockResponse(
-            {"result": result_info, "error": None, "id": 0},
-            ok=True,
-            status_code=200,
-        ),
+    mock_post.return_value = MockResponse(
+        {"result": result_info, "error": None, "id": 0},
+        ok=True,
+        status_code=200,
     )
 
     response = client.connect_to_host(host_id)
     assert response.result == result_info
     assert mock_post.called
     assert mock_post.call_count == 1
-    assert mock_post.call_args[1]["json"]["method"] == "web.connect"
+    assert posted_payload(mock_post)["method"] == "web.connect"
 
 
 def test_test_listen_port(client_mock):
     client, mock_post = client_mock
 
-    mock_post.side_effect = (
-        MockResponse(
-            {"result": True, "error": None, "id": 0},
-            ok=True,
-            status_code=200,
-        ),
+    mock_post.return_value = MockResponse(
+        {"result": True, "error": None, "id": 0},
+        ok=True,
+        status_code=200,
     )
 
     response = client.test_listen_port()
     assert response is True
     assert mock_post.called
     assert mock_post.call_count == 1
-    assert mock_post.call_args[1]["json"]["method"] == "core.test_listen_port"
+    assert posted_payload(mock_post)["method"] == "core.test_listen_port"
 
-    mock_post.side_effect = (
-        MockResponse(
-            {"result": None, "error": None, "id": 1},
-            ok=True,
-            status_code=200,
-        ),
-    )
+    mock_post.return_value = null_response
 
     response = client.test_listen_port()
     assert response is False
     assert mock_post.called
     assert mock_post.call_count == 2
-    assert mock_post.call_args[1]["json"]["method"] == "core.test_listen_port"
+    assert posted_payload(mock_post)["method"] == "core.test_listen_port"
+
+
+def test_execute_call_logs_response(client_mock, caplog):
+    client, mock_post = client_mock
+
+    mock_post.return_value = MockResponse(
+        {"result": True, "error": None, "id": 0},
+        ok=True,
+        status_code=200,
+    )
+
+    with caplog.at_level(logging.DEBUG, logger="deluge_web_client.client"):
+        client.check_connected()
+
+    assert "RPC response: {'result': True, 'error': None, 'id': 0}" in caplog.text
 
 
 def test_execute_call_with_error(client_mock):
@@ -243,3 +308,21 @@ def test_execute_call_with_error(client_mock):
     ):
         with pytest.raises(DelugeWebClientError, match="Payload:"):
             client.execute_call(payload)
+
+
+@pytest.mark.parametrize(
+    "error, expected",
+    [
+        (None, None),
+        ("", None),
+        ("Label already exists", "Label already exists"),
+        ("  Some error occurred ]", "Some error occurred"),
+        ("Some error occurred]]", "Some error occurred"),
+        (
+            {"message": "Label already exists", "code": 4},
+            {"message": "Label already exists", "code": 4},
+        ),
+    ],
+)
+def test_normalize_exception(error, expected):
+    assert _normalize_exception(error) == expected
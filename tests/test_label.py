@@ -1,5 +1,6 @@
+import json
 import pytest
-from tests import MockResponse
+from tests import MockResponse, null_response, posted_payload
 from unittest.mock import MagicMock
 from deluge_web_client import DelugeWebClientError
 
@@ -7,59 +8,45 @@ from deluge_web_client import DelugeWebClientError
 def test_get_labels(client_mock):
     client, mock_post = client_mock
 
-    mock_post.side_effect = (
-        MockResponse(
-            {"result": ["movies", "shows"], "error": None, "id": 0},
-            ok=True,
-            status_code=200,
-        ),
+    mock_post.return_value = MockResponse(
+        {"result": ["movies", "shows"], "error": None, "id": 0},
+        ok=True,
+        status_code=200,
     )
 
     response = client.get_labels()
     assert response.result == ["movies", "shows"]
     assert mock_post.called
     assert mock_post.call_count == 1
-    assert mock_post.call_args[1]["json"]["method"] == "label.get_labels"
+    assert posted_payload(mock_post)["method"] == "label.get_labels"
 
 
 def test_set_label(client_mock):
     client, mock_post = client_mock
 
-    mock_post.side_effect = (
-        MockResponse(
-            {"result": None, "error": None, "id": 0},
-            ok=True,
-            status_code=200,
-        ),
-    )
+    mock_post.return_value = null_response
 
     response = client.set_label("ea5e27b8f2662a5xxxxxxxx214c94190xxxxxxxx", "movies")
     assert response.result is None
     assert mock_post.called
     assert mock_post.call_count == 1
-    assert mock_post.call_args[1]["json"]["params"] == [
+    assert posted_payload(mock_post)["params"] == [
         "ea5e27b8f2662a5xxxxxxxx214c94190xxxxxxxx",
         "movies",
     ]
-    assert mock_post.call_args[1]["json"]["method"] == "label.set_torrent"
+    assert posted_payload(mock_post)["method"] == "label.set_torrent"
 
 
 def test_add_label_success(client_mock):
     client, mock_post = client_mock
 
-    mock_post.side_effect = (
-        MockResponse(
-            {"result": None, "error": None, "id": 0},
-            ok=True,
-            status_code=200,
-        ),
-    )
+    mock_post.return_value = null_response
 
     response = client.add_label("movies")
     assert response.result is None
     assert mock_post.called
     assert mock_post.call_count == 1
-    assert mock_post.call_args[1]["json"]["method"] == "label.add"
+    assert posted_payload(mock_post)["method"] == "label.add"
 
 
 def test_add_label_already_exists(client_mock):
@@ -73,12 +60,10 @@ def test_add_label_already_exists(client_mock):
         },
         "id": 1,
     }
-    mock_post.side_effect = (
-        MockResponse(
-            already_exists_info,
-            ok=True,
-            status_code=200,
-        ),
+    mock_post.return_value = MockResponse(
+        already_exists_info,
+        ok=True,
+        status_code=200,
     )
 
     response = client.add_label("movies")
@@ -87,22 +72,20 @@ def test_add_label_already_exists(client_mock):
     assert "Label already exists" in response.error.get("message", "")
     assert mock_post.called
     assert mock_post.call_count == 1
-    assert mock_post.call_args[1]["json"]["method"] == "label.add"
+    assert posted_payload(mock_post)["method"] == "label.add"
 
 
 def test_add_label_raises_error(client_mock):
     client, mock_post = client_mock
 
-    mock_post.side_effect = (
-        MockResponse(
-            {
-                "result": None,
-                "error": "Random error",
-                "id": 2,
-            },
-            ok=True,
-            status_code=200,
-        ),
+    mock_post.return_value = MockResponse(
+        {
+            "result": None,
+            "error": "Random error",
+            "id": 2,
+        },
+        ok=True,
+        status_code=200,
     )
 
     with pytest.raises(DelugeWebClientError, match="Error adding label:\nRandom error"):
@@ -112,30 +95,26 @@ def test_add_label_raises_error(client_mock):
 def test_apply_label(client_mock):
     client, _ = client_mock
 
-    # mock the add_label and set_label methods using side_effect to simulate real behavior
-    client.add_label = MagicMock(
-        side_effect=(
-            MockResponse(
-                {"result": None, "error": None, "id": 0},
-                ok=True,
-                status_code=200,
-                reason="test",
-            ),
+    # mock the add_label and set_label methods to simulate real behavior
+    client._add_label_raw = MagicMock(
+        return_value=MockResponse(
+            {"result": None, "error": None, "id": 0},
+            ok=True,
+            status_code=200,
+            reason="test",
         )
     )
-    client.set_label = MagicMock(
-        side_effect=(
-            MockResponse(
-                {"result": None, "error": None, "id": 1},
-                ok=True,
-                status_code=200,
-                reason="test",
-            ),
+    client._set_label_raw = MagicMock(
+        return_value=MockResponse(
+            {"result": None, "error": None, "id": 1},
+            ok=True,
+            status_code=200,
+            reason="test",
         )
     )
 
     info_hash = "mocked_info_hash"
-    label = "movies"
+    label = "Movies"
     timeout = 30
 
     # call the helper method
@@ -143,12 +122,56 @@ def test_apply_label(client_mock):
         info_hash, label, timeout
     )
 
-    # assert that add_label and set_label were called with correct arguments
-    client.add_label.assert_called_once_with(label, timeout)
-    client.set_label.assert_called_once_with(info_hash, label, timeout)
+    # assert that the label was lowercased once and passed to both calls
+    client._add_label_raw.assert_called_once_with("movies", timeout)
+    client._set_label_raw.assert_called_once_with(info_hash, "movies", timeout)
 
     # assert that the responses are as expected
     assert response_add_label.json().get("result") is None
     assert response_add_label.json().get("id") == 0
     assert response_set_label.json().get("result") is None
     assert response_set_label.json().get("id") == 1
+
+
+def test_apply_label_adds_label_once(client_mock):
+    client, mock_post = client_mock
+
+    mock_post.return_value = null_response
+
+    client._apply_label("hash_1", "Movies", 30)
+    client._apply_label("hash_2", "movies", 30)
+
+    methods = [
+        json.loads(call[1]["data"])["method"] for call in mock_post.call_args_list
+    ]
+    assert methods == ["label.add", "label.set_torrent", "label.set_torrent"]
+
+
+def test_apply_label_re_adds_removed_label(client_mock):
+    client, mock_post = client_mock
+
+    mock_post.side_effect = (
+        null_response,
+        null_response,
+        MockResponse(
+            {"result": None, "error": "Unknown Label", "id": 0},
+            ok=True,
+            status_code=200,
+        ),
+        null_response,
+        null_response,
+    )
+
+    client._apply_label("hash_1", "movies", 30)
+    client._apply_label("hash_2", "movies", 30)
+
+    methods = [
+        json.loads(call[1]["data"])["method"] for call in mock_post.call_args_list
+    ]
+    assert methods == [
+        "label.add",
+        "label.set_torrent",
+        "label.set_torrent",
+        "label.add",
+        "label.set_torrent",
+    ]
@@ -1,4 +1,5 @@
 import pytest
+from unittest.mock import patch
 from deluge_web_client import TorrentState
 
 
@@ -33,3 +34,21 @@ def test_torrent_state_invalid_value():
     with pytest.raises(ValueError) as exc_info:
         TorrentState("invalid_state")
     assert str(exc_info.value) == "No TorrentState member with value 'invalid_state'"
+
+
+def test_torrent_state_non_string_value():
+    """Test that non string values raise ValueError instead of AttributeError."""
+    with pytest.raises(ValueError):
+        TorrentState(1)
+
+
+def test_torrent_state_common_cases_skip_missing():
+    """Test that lower and upper case values resolve without calling _missing_."""
+    with patch.object(
+        TorrentState, "_missing_", side_effect=AssertionError("_missing_ called")
+    ):
+        assert TorrentState("seeding") is TorrentState.SEEDING
+        assert TorrentState("SEEDING") is TorrentState.SEEDING
+        assert TorrentState("Seeding") is TorrentState.SEEDING
+    assert TorrentState("sEeDiNg") is TorrentState.SEEDING
+    assert len(TorrentState) == 8
@@ -1,24 +1,35 @@
+import asyncio
 import base64
+import json
+import os
+import threading
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from tests import MockResponse, example_status_dict, example_multi_status_dict
-from unittest.mock import patch, mock_open, MagicMock
-from deluge_web_client import DelugeWebClientError
+from tests import MockResponse, null_response, posted_payload
+from unittest.mock import patch
+from deluge_web_client import DelugeWebClientError, Response
 
+# Mocked content of a torrent file and what it's expected to be encoded to
+MOCK_TORRENT_CONTENT = b"mocked torrent file content"
+MOCK_TORRENT_BASE64 = base64.b64encode(MOCK_TORRENT_CONTENT).decode("utf-8")
 
-def test_upload_torrent(client_mock):
+
+def _expected_payload(method: str, params: list, id_: int = 0) -> dict:
+    """Builds the JSON-RPC payload the client is expected to send"""
+    return {"method": method, "params": params, "id": id_}
+
+
+def test_upload_torrent(client_mock, tmp_path):
     client, _ = client_mock
 
-    # Mock parameters for the test
-    torrent_path = "mocked_torrent_file.torrent"
-    # Mocked content of the torrent file
-    mocked_file_content = b"mocked torrent file content"
-    base64_encoded_content = base64.b64encode(mocked_file_content).decode("utf-8")
+    # Write the mocked torrent file to disk so it can be memory mapped
+    torrent_path = tmp_path / "mocked_torrent_file.torrent"
+    torrent_path.write_bytes(MOCK_TORRENT_CONTENT)
 
-    # Mock the open function to simulate reading a torrent file
-    with patch("builtins.open", mock_open(read_data=mocked_file_content)), patch.object(
-        client, "_upload_helper", return_value=MagicMock(result=True, error=None)
-    ) as mock_upload_helper:
+    with patch.object(
+        client, "_upload_raw", return_value=Response(result=True, error=None, id=None)
+    ) as mock_upload_raw:
         # Call the upload_torrent method
         response = client.upload_torrent(
             torrent_path, add_paused=True, save_directory="/downloads"
@@ -29,11 +40,11 @@ def test_upload_torrent(client_mock):
     assert response.error is None
 
     # Prepare expected payload for the upload_helper
-    expected_payload = {
-        "method": "core.add_torrent_file",
-        "params": [
+    expected_payload = _expected_payload(
+        "core.add_torrent_file",
+        [
             str(torrent_path),
-            base64_encoded_content,
+            MOCK_TORRENT_BASE64,
             {
                 "add_paused": True,
                 "seed_mode": False,
@@ -41,29 +52,79 @@ def test_upload_torrent(client_mock):
                 "download_location": "/downloads",
             },
         ],
-        "id": client.ID,
-    }
+    )
 
-    # Verify that the correct payload was sent to _upload_helper
-    mock_upload_helper.assert_called_once_with(expected_payload, None, 30)
+    # Verify that the streamed body joins up to the expected payload
+    mock_upload_raw.assert_called_once()
+    body, label, timeout = mock_upload_raw.call_args[0]
+    assert (label, timeout) == (None, 30)
+    streamed = b"".join(body)
+    assert json.loads(streamed) == expected_payload
+    assert len(body) == len(streamed)
 
 
-def test_upload_torrents(client_mock):
+def test_upload_large_torrent_streamed(client_mock, tmp_path):
     client, _ = client_mock
 
-    # Mock the responses for upload_torrent
-    mock_responses = {
-        "torrent1": MagicMock(result=True, error=None),
-        "torrent2": MagicMock(result=True, error=None),
-    }
+    # spans several encoding chunks and doesn't end on a 3 byte boundary
+    content = os.urandom(200_001)
+    torrent_path = tmp_path / "large.torrent"
+    torrent_path.write_bytes(content)
 
-    # Patch the upload_torrent method to return mocked responses
-    with patch.object(client, "upload_torrent") as mock_upload_torrent:
-        # Set side effects for multiple calls
-        mock_upload_torrent.side_effect = [
-            mock_responses["torrent1"],
-            mock_responses["torrent2"],
-        ]
+    with patch.object(client, "_upload_raw") as mock_upload_raw:
+        client.upload_torrent(torrent_path)
+
+    body = mock_upload_raw.call_args[0][0]
+    streamed = b"".join(body)
+    assert len(body) == len(streamed)
+    assert json.loads(streamed)["params"][1] == base64.b64encode(content).decode()
+    # the body can be iterated again when a request is retried
+    assert b"".join(body) == streamed
+
+
+def test_upload_empty_torrent(client_mock, mock_upload_helper, tmp_path):
+    client, _ = client_mock
+
+    torrent_path = tmp_path / "empty.torrent"
+    torrent_path.touch()
+
+    client.upload_torrent(torrent_path)
+
+    assert mock_upload_helper.call_args[0][0]["params"][1] == ""
+
+
+@pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="requires named pipes")
+def test_upload_torrent_from_pipe(client_mock, mock_upload_helper, tmp_path):
+    client, _ = client_mock
+
+    # larger than a single read so the chunked encoding is exercised
+    content = os.urandom(200_000)
+    torrent_path = tmp_path / "piped.torrent"
+    os.mkfifo(torrent_path)
+
+    def write_pipe():
+        with open(torrent_path, "wb") as pipe:
+            pipe.write(content)
+
+    writer = threading.Thread(target=write_pipe)
+    writer.start()
+    client.upload_torrent(torrent_path)
+    writer.join()
+
+    assert mock_upload_helper.call_args[0][0]["params"][1] == base64.b64encode(
+        content
+    ).decode("ascii")
+
+
+def test_upload_torrents(client_mock):
+    client, _ = client_mock
+
+    # Patch the single torrent upload to return mocked responses
+    with patch.object(client, "_upload_torrent_with_args") as mock_upload:
+        # Responses are only created as the uploads consume them
+        mock_upload.side_effect = (
+            Response(result=True, error=None, id=None) for _ in range(2)
+        )
 
         # Define the torrent paths to upload
         torrents = ["path/to/torrent1.torrent", "path/to/torrent2.torrent"]
@@ -78,28 +139,38 @@ def test_upload_torrents(client_mock):
     assert results["torrent1"].error is None
     assert results["torrent2"].error is None
 
-    # Verify that upload_torrent was called with the correct arguments
-    mock_upload_torrent.assert_any_call(
+    # Verify that each torrent was uploaded with the correct arguments
+    mock_upload.assert_any_call(
         Path("path/to/torrent1.torrent"),
-        save_directory="/downloads",
-        label=None,
-        timeout=30,
+        {
+            "add_paused": False,
+            "seed_mode": False,
+            "auto_managed": False,
+            "download_location": "/downloads",
+        },
+        None,
+        30,
     )
-    mock_upload_torrent.assert_any_call(
+    mock_upload.assert_any_call(
         Path("path/to/torrent2.torrent"),
-        save_directory="/downloads",
-        label=None,
-        timeout=30,
+        {
+            "add_paused": False,
+            "seed_mode": False,
+            "auto_managed": False,
+            "download_location": "/downloads",
+        },
+        None,
+        30,
     )
 
 
 def test_upload_torrents_failure(client_mock):
     client, _ = client_mock
 
-    # Mock the upload_torrent method to raise an exception for one of the torrents
-    with patch.object(client, "upload_torrent") as mock_upload_torrent:
-        mock_upload_torrent.side_effect = [
-            MagicMock(result=True, error=None),  # First upload succeeds
+    # Mock the single torrent upload to raise an exception for one of the torrents
+    with patch.object(client, "_upload_torrent_with_args") as mock_upload:
+        mock_upload.side_effect = [
+            Response(result=True, error=None, id=None),  # First upload succeeds
             Exception("Upload failed"),  # Second upload fails
         ]
 
@@ -111,41 +182,116 @@ def test_upload_torrents_failure(client_mock):
         ):
             client.upload_torrents(torrents)
 
-        # Verify that upload_torrent was called for both torrents
-        mock_upload_torrent.assert_any_call(
+        # Verify that both torrents were uploaded
+        mock_upload.assert_any_call(
             Path("path/to/torrent1.torrent"),
-            save_directory=None,
-            label=None,
-            timeout=30,
+            {
+                "add_paused": False,
+                "seed_mode": False,
+                "auto_managed": False,
+                "download_location": None,
+            },
+            None,
+            30,
         )
-        mock_upload_torrent.assert_any_call(
+        mock_upload.assert_any_call(
             Path("path/to/torrent2.torrent"),
-            save_directory=None,
-            label=None,
-            timeout=30,
+            {
+                "add_paused": False,
+                "seed_mode": False,
+                "auto_managed": False,
+                "download_location": None,
+            },
+            None,
+            30,
+        )
+
+
+def test_upload_torrents_concurrent(client_mock):
+    client, _ = client_mock
+
+    with patch.object(client, "_upload_torrent_with_args") as mock_upload:
+        mock_upload.side_effect = lambda torrent_path, *_: Response(
+            result=torrent_path.stem, error=None, id=None
         )
 
+        torrents = [f"path/to/torrent{i}.torrent" for i in range(5)]
+        results = client.upload_torrents(torrents, max_workers=3)
 
-def test_add_torrent_magnet(client_mock):
+    assert mock_upload.call_count == 5
+    assert list(results) == [f"torrent{i}" for i in range(5)]
+    assert all(results[name].result == name for name in results)
+
+
+def test_upload_torrents_async(client_mock):
+    client, _ = client_mock
+
+    with patch.object(client, "_upload_torrent_with_args") as mock_upload:
+        mock_upload.side_effect = lambda torrent_path, *_: Response(
+            result=torrent_path.stem, error=None, id=None
+        )
+
+        torrents = [f"path/to/torrent{i}.torrent" for i in range(5)]
+        results = asyncio.run(
+            client.upload_torrents_async(
+                torrents, save_directory="/downloads", max_concurrency=2
+            )
+        )
+
+    assert mock_upload.call_count == 5
+    assert list(results) == [f"torrent{i}" for i in range(5)]
+    assert all(results[name].result == name for name in results)
+    mock_upload.assert_any_call(
+        Path("path/to/torrent0.torrent"),
+        {
+            "add_paused": False,
+            "seed_mode": False,
+            "auto_managed": False,
+            "download_location": "/downloads",
+        },
+        None,
+        30,
+    )
+
+
+def test_upload_torrents_async_failure(client_mock):
+    client, _ = client_mock
+
+    with patch.object(client, "_upload_torrent_with_args") as mock_upload:
+        mock_upload.side_effect = [
+            Response(result=True, error=None, id=None),
+            Exception("Upload failed"),
+            Response(result=True, error=None, id=None),
+        ]
+
+        torrents = [f"path/to/torrent{i}.torrent" for i in range(1, 4)]
+
+        with pytest.raises(
+            DelugeWebClientError, match="Failed to upload torrent2.torrent:"
+        ):
+            asyncio.run(client.upload_torrents_async(torrents, max_concurrency=1))
+
+    # the queued third upload is cancelled after the second one fails
+    assert mock_upload.call_count == 2
+
+
+def test_add_torrent_magnet(client_mock, mock_upload_helper):
     client, _ = client_mock
     magnet_uri = "magnet:?xt=urn:btih:...&dn=example"
 
     # Mock the response for _upload_helper
-    mock_response = MagicMock()
-    mock_response.json.return_value = {"result": "Ok", "id": client.ID}
+    mock_response = Response(result="Ok", error=None, id=0)
+    mock_upload_helper.return_value = mock_response
 
-    with patch.object(
-        client, "_upload_helper", return_value=mock_response
-    ) as mock_upload_helper:
-        response = client.add_torrent_magnet(
-            magnet_uri, add_paused=True, save_directory="/downloads"
-        )
+    response = client.add_torrent_magnet(
+        magnet_uri, add_paused=True, save_directory="/downloads"
+    )
 
     # Assertions to check the response is as expected
     assert response == mock_response
-    expected_payload = {
-        "method": "core.add_torrent_magnet",
-        "params": [
+    expected_payload = _expected_payload(
+        "core.add_torrent_magnet",
+        [
             str(magnet_uri),
             {
                 "add_paused": True,
@@ -154,45 +300,39 @@ def test_add_torrent_magnet(client_mock):
                 "download_location": "/downloads",
             },
         ],
-        "id": client.ID,
-    }
+    )
 
     # Verify that the correct payload was sent to _upload_helper
     mock_upload_helper.assert_called_once_with(expected_payload, None, 30)
 
 
-def test_add_torrent_magnet_failure(client_mock):
+def test_add_torrent_magnet_failure(client_mock, mock_upload_helper):
     client, _ = client_mock
     magnet_uri = "magnet:?xt=urn:btih:..."
 
     # Mock the _upload_helper to raise an exception
-    with patch.object(
-        client, "_upload_helper", side_effect=DelugeWebClientError("Upload failed")
-    ):
-        with pytest.raises(DelugeWebClientError, match=r".+"):
-            client.add_torrent_magnet(magnet_uri)
+    mock_upload_helper.side_effect = DelugeWebClientError("Upload failed")
+    with pytest.raises(DelugeWebClientError, match=r".+"):
+        client.add_torrent_magnet(magnet_uri)
 
 
-def test_add_torrent_url(client_mock):
+def test_add_torrent_url(client_mock, mock_upload_helper):
     client, _ = client_mock
     torrent_url = "http://example.com/torrent"
 
     # Mock the response for _upload_helper
-    mock_response = MagicMock()
-    mock_response.json.return_value = {"result": "Ok", "id": client.ID}
+    mock_response = Response(result="Ok", error=None, id=0)
+    mock_upload_helper.return_value = mock_response
 
-    with patch.object(
-        client, "_upload_helper", return_value=mock_response
-    ) as mock_upload_helper:
-        response = client.add_torrent_url(
-            torrent_url, add_paused=False, save_directory="/downloads"
-        )
+    response = client.add_torrent_url(
+        torrent_url, add_paused=False, save_directory="/downloads"
+    )
 
     # Assertions to check the response is as expected
     assert response == mock_response
-    expected_payload = {
-        "method": "core.add_torrent_url",
-        "params": [
+    expected_payload = _expected_payload(
+        "core.add_torrent_url",
+        [
             str(torrent_url),
             {
                 "add_paused": False,
@@ -201,23 +341,20 @@ def test_add_torrent_url(client_mock):
                 "download_location": "/downloads",
             },
         ],
-        "id": client.ID,
-    }
+    )
 
     # Verify that the correct payload was sent to _upload_helper
     mock_upload_helper.assert_called_once_with(expected_payload, None, 30)
 
 
-def test_add_torrent_url_failure(client_mock):
+def test_add_torrent_url_failure(client_mock, mock_upload_helper):
     client, _ = client_mock
     torrent_url = "http://example.com/torrent"
 
     # Mock the _upload_helper to raise an exception
-    with patch.object(
-        client, "_upload_helper", side_effect=DelugeWebClientError("Upload failed")
-    ):
-        with pytest.raises(DelugeWebClientError, match=r".+"):
-            client.add_torrent_url(torrent_url)
+    mock_upload_helper.side_effect = DelugeWebClientError("Upload failed")
+    with pytest.raises(DelugeWebClientError, match=r".+"):
+        client.add_torrent_url(torrent_url)
 
 
 def test_upload_helper_success(client_mock):
@@ -231,12 +368,28 @@ def test_upload_helper_success(client_mock):
         return_value=MockResponse(
             json_data={"result": "info_hash"}, ok=True, status_code=200
         ),
-    ):
+    ) as mock_post:
         response = client._upload_helper(payload, label, timeout=30)
 
     assert response.result == "info_hash"
     assert response.error is None
-    assert client.ID == 4
+    # upload, add label, set label and resume
+    assert mock_post.call_count == 4
+
+
+def test_request_ids_are_unique(client_mock):
+    client, mock_post = client_mock
+
+    mock_post.return_value = null_response
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        for _ in range(50):
+            executor.submit(client.pause_torrent, "mock_torrent_id")
+        for _ in range(50):
+            executor.submit(client.check_connected)
+
+    ids = [json.loads(call[1]["data"])["id"] for call in mock_post.call_args_list]
+    assert sorted(ids) == list(range(100))
 
 
 def test_upload_helper_failure(client_mock):
@@ -277,16 +430,14 @@ def test_get_torrent_files(client_mock):
         "type": "dir",
     }
 
-    mock_post.side_effect = (
-        MockResponse(
-            {
-                "result": contents,
-                "error": None,
-                "id": 1,
-            },
-            ok=True,
-            status_code=200,
-        ),
+    mock_post.return_value = MockResponse(
+        {
+            "result": contents,
+            "error": None,
+            "id": 1,
+        },
+        ok=True,
+        status_code=200,
     )
 
     response = client.get_torrent_files("mock_torrent_id")
@@ -295,222 +446,90 @@ def test_get_torrent_files(client_mock):
     assert response.result == contents
     assert mock_post.called
     assert mock_post.call_count == 1
-    assert mock_post.call_args[1]["json"]["method"] == "web.get_torrent_files"
+    assert posted_payload(mock_post)["method"] == "web.get_torrent_files"
 
 
-def test_get_torrent_status(client_mock):
+def test_get_torrent_status(client_mock, status_dict):
     client, mock_post = client_mock
 
-    mock_post.side_effect = (
-        MockResponse(
-            {
-                "result": example_status_dict,
-                "error": None,
-                "id": 1,
-            },
-            ok=True,
-            status_code=200,
-        ),
+    mock_post.return_value = MockResponse(
+        {
+            "result": status_dict,
+            "error": None,
+            "id": 1,
+        },
+        ok=True,
+        status_code=200,
     )
 
     response = client.get_torrent_status("mock_torrent_id")
     assert response.error is None
     assert response.id == 1
-    assert response.result == example_status_dict
+    assert response.result == status_dict
     assert mock_post.called
     assert mock_post.call_count == 1
-    assert mock_post.call_args[1]["json"]["method"] == "core.get_torrent_status"
+    assert posted_payload(mock_post)["method"] == "core.get_torrent_status"
 
 
-def test_get_torrents_status(client_mock):
+def test_get_torrents_status(client_mock, multi_status_dict):
     client, mock_post = client_mock
 
-    mock_post.side_effect = (
-        MockResponse(
-            {
-                "result": example_multi_status_dict,
-                "error": None,
-                "id": 1,
-            },
-            ok=True,
-            status_code=200,
-        ),
+    mock_post.return_value = MockResponse(
+        {
+            "result": multi_status_dict,
+            "error": None,
+            "id": 1,
+        },
+        ok=True,
+        status_code=200,
     )
 
     response = client.get_torrents_status("mock_torrent_id")
     assert response.error is None
     assert response.id == 1
-    assert response.result == example_multi_status_dict
+    assert response.result == multi_status_dict
     assert mock_post.called
     assert mock_post.call_count == 1
-    assert mock_post.call_args[1]["json"]["method"] == "core.get_torrents_status"
+    assert posted_payload(mock_post)["method"] == "core.get_torrents_status"
 
 
-def test_pause_torrent(client_mock):
-    client, mock_post = client_mock
-
-    mock_post.side_effect = (
-        MockResponse(
-            {
-                "result": None,
-                "error": None,
-                "id": 1,
-            },
-            ok=True,
-            status_code=200,
+@pytest.mark.parametrize(
+    "method, args, rpc_method",
+    [
+        ("pause_torrent", ("mock_torrent_id",), "core.pause_torrent"),
+        (
+            "pause_torrents",
+            (["mock_torrent_id1", "mock_torrent_id2"],),
+            "core.pause_torrents",
         ),
-    )
-
-    response = client.pause_torrent("mock_torrent_id")
-    assert response.error is None
-    assert response.id == 1
-    assert response.result is None
-    assert mock_post.called
-    assert mock_post.call_count == 1
-    assert mock_post.call_args[1]["json"]["method"] == "core.pause_torrent"
-
-
-def test_pause_torrents(client_mock):
-    client, mock_post = client_mock
-
-    mock_post.side_effect = (
-        MockResponse(
-            {
-                "result": None,
-                "error": None,
-                "id": 1,
-            },
-            ok=True,
-            status_code=200,
+        ("remove_torrent", ("mock_torrent_id",), "core.remove_torrent"),
+        (
+            "remove_torrents",
+            (["mock_torrent_id1", "mock_torrent_id2"],),
+            "core.remove_torrents",
         ),
-    )
-
-    response = client.pause_torrents(["mock_torrent_id1", "mock_torrent_id2"])
-    assert response.error is None
-    assert response.id == 1
-    assert response.result is None
-    assert mock_post.called
-    assert mock_post.call_count == 1
-    assert mock_post.call_args[1]["json"]["method"] == "core.pause_torrents"
-
-
-def test_remove_torrent(client_mock):
-    client, mock_post = client_mock
-
-    mock_post.side_effect = (
-        MockResponse(
-            {
-                "result": None,
-                "error": None,
-                "id": 1,
-            },
-            ok=True,
-            status_code=200,
+        ("resume_torrent", ("mock_torrent_id",), "core.resume_torrent"),
+        (
+            "resume_torrents",
+            (["mock_torrent_id1", "mock_torrent_id2"],),
+            "core.resume_torrents",
         ),
-    )
-
-    response = client.remove_torrent("mock_torrent_id")
-    assert response.error is None
-    assert response.id == 1
-    assert response.result is None
-    assert mock_post.called
-    assert mock_post.call_count == 1
-    assert mock_post.call_args[1]["json"]["method"] == "core.remove_torrent"
-
-
-def test_remove_torrents(client_mock):
-    client, mock_post = client_mock
-
-    mock_post.side_effect = (
-        MockResponse(
-            {
-                "result": None,
-                "error": None,
-                "id": 1,
-            },
-            ok=True,
-            status_code=200,
+        (
+            "set_torrent_trackers",
+            ("mock_torrent_id", [{"tracker1": 1}, {"tracker2": 1}]),
+            "core.set_torrent_trackers",
         ),
-    )
-
-    response = client.remove_torrents(["mock_torrent_id1", "mock_torrent_id2"])
-    assert response.error is None
-    assert response.id == 1
-    assert response.result is None
-    assert mock_post.called
-    assert mock_post.call_count == 1
-    assert mock_post.call_args[1]["json"]["method"] == "core.remove_torrents"
-
-
-def test_resume_torrent(client_mock):
+    ],
+)
+def test_torrent_action(client_mock, method, args, rpc_method):
     client, mock_post = client_mock
 
-    mock_post.side_effect = (
-        MockResponse(
-            {
-                "result": None,
-                "error": None,
-                "id": 1,
-            },
-            ok=True,
-            status_code=200,
-        ),
-    )
+    mock_post.return_value = null_response
 
-    response = client.resume_torrent("mock_torrent_id")
+    response = getattr(client, method)(*args)
     assert response.error is None
-    assert response.id == 1
-    assert response.result is None
-    assert mock_post.called
-    assert mock_post.call_count == 1
-    assert mock_post.call_args[1]["json"]["method"] == "core.resume_torrent"
-
-
-def test_resume_torrents(client_mock):
-    client, mock_post = client_mock
-
-    mock_post.side_effect = (
-        MockResponse(
-            {
-                "result": None,
-                "error": None,
-                "id": 1,
-            },
-            ok=True,
-            status_code=200,
-        ),
-    )
-
-    response = client.resume_torrents(["mock_torrent_id1", "mock_torrent_id2"])
-    assert response.error is None
-    assert response.id == 1
-    assert response.result is None
-    assert mock_post.called
-    assert mock_post.call_count == 1
-    assert mock_post.call_args[1]["json"]["method"] == "core.resume_torrents"
-
-
-def test_set_torrent_trackers(client_mock):
-    client, mock_post = client_mock
-
-    mock_post.side_effect = (
-        MockResponse(
-            {
-                "result": None,
-                "error": None,
-                "id": 1,
-            },
-            ok=True,
-            status_code=200,
-        ),
-    )
-
-    response = client.set_torrent_trackers(
-        "mock_torrent_id", [{"tracker1": 1}, {"tracker2": 1}]
-    )
-    assert response.error is None
-    assert response.id == 1
+    assert response.id == 0
     assert response.result is None
     assert mock_post.called
     assert mock_post.call_count == 1
-    assert mock_post.call_args[1]["json"]["method"] == "core.set_torrent_trackers"
+    assert posted_payload(mock_post)["method"] == rpc_method